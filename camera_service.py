@@ -2,23 +2,55 @@
 import os
 import time
 import json
+import struct
 import socket
-import math
+import queue
+import threading
 import cv2
-import mediapipe as mp
 import numpy as np
 try:
     from picamera2 import Picamera2
 except Exception:
     Picamera2 = None
+try:
+    from numba import njit, prange
+except Exception:
+    njit = None
 
 from constants import CAPTURE_WIDTH, CAPTURE_HEIGHT, CAPTURE_ASPECT
+from hand_detector import create_hand_detector
 
 SOCKET_PATH = "/tmp/hand_tracker.sock"
+# working capture device from the last run, so startup skips probing
+CAMERA_CONFIG = os.path.expanduser("~/.arpi/camera.json")
 TARGET_FPS = 60.0
+# preview needs a desktop: on a headless Pi imshow would still try to open an X/Wayland window
+HAS_DISPLAY = os.name == "nt" or bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+PREVIEW = os.environ.get("ARPI_PREVIEW") == "1" and HAS_DISPLAY
 ROI_SCALE = 0.95
 DETECTION_CONF = 0.45
 TRACKING_CONF = 0.5
+# lite landmark model and the realistic number of hands over the table
+MAX_HANDS = 4
+MODEL_COMPLEXITY = 0
+# wire format per frame: HEADER (ts, n_tips) followed by n_tips TIP (hand_idx, proj_x, proj_y)
+HEADER = struct.Struct("<dB")
+TIP = struct.Struct("<BHH")
+# contrast equalization on every frame, with the mapping (a LUT) refreshed every EQUALIZE_LUT_PERIOD,
+# so MediaPipe never sees brightness jump between enhanced and raw frames
+ENHANCE = True
+# with numba installed, fuse contrast equalization and the conversion to RGB into one pass over the ROI
+FUSED_ENHANCE = njit is not None and ENHANCE
+EQUALIZE_LUT_PERIOD = 0.2
+EQUALIZE_CLIP = 2.0
+# MediaPipe resizes to ~224px internally; feed it a downscaled frame (landmarks are normalized)
+INFER_WIDTH = 480
+# zero-copy, latest-frame-only capture (needs OpenCV built with GStreamer); falls back to V4L2 indices
+GST_PIPELINE = ("v4l2src device=/dev/video{idx} ! image/jpeg,width=1280,height=720,framerate={fps}/1 ! "
+                "jpegdec ! videoconvert ! video/x-raw,format=BGR ! appsink drop=true max-buffers=1 sync=false")
+# Picamera2 counterpart: two buffers and no request queue, so every capture is the newest sensor frame
+PICAM_LOW_LATENCY = {"buffer_count": 2, "queue": False,
+                     "controls": {"FrameDurationLimits": (16666, 33333)}}
 
 def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
     # remove existing socket
@@ -28,78 +60,28 @@ def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
     except Exception:
         pass
 
-    mp_hands = mp.solutions.hands
-    hands = mp_hands.Hands(max_num_hands=8, min_detection_confidence=DETECTION_CONF, min_tracking_confidence=TRACKING_CONF)
+    # same backend chain as hand_tracker: Tasks GPU -> Tasks CPU -> legacy Hands (ARPI_GPU_DELEGATE=0 skips GPU)
+    detect_hands, close_detector = create_hand_detector(MAX_HANDS, DETECTION_CONF, TRACKING_CONF, MODEL_COMPLEXITY,
+                                                        log_prefix="camera_service")
 
-    # camera init: try USB OpenCV (usb index 1) first, then explicit device 0, then Picamera2 last
-    picam = None
-    cap = None
-    tried_indices = [1, 0]  # first try a likely USB index (1), then device 0
-    for idx in tried_indices:
-        try:
-            cap_try = cv2.VideoCapture(idx)
-            try:
-                cap_try.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-                cap_try.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-                cap_try.set(cv2.CAP_PROP_FPS, int(target_fps))
-            except Exception:
-                pass
-            ret, _ = cap_try.read()
-            if ret:
-                cap = cap_try
-                print(f"camera_service: using OpenCV device {idx}")
-                break
-            else:
-                try:
-                    cap_try.release()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-    # If no OpenCV USB device opened, try Picamera2 as a last fallback
-    if cap is None and Picamera2 is not None:
-        try:
-            picam = Picamera2()
-            try:
-                cfg = picam.create_preview_configuration(main={"size": (800, 600)})
-            except Exception:
-                cfg = picam.create_preview_configuration(main={"size": (640, 480)})
-            picam.configure(cfg)
-            try:
-                picam.set_controls({"ExposureTime": 20000, "AnalogueGain": 4.0, "AwbEnable": True})
-            except Exception:
-                pass
-            picam.start()
-            print("camera_service: using Picamera2 (fallback)")
-        except Exception:
-            picam = None
-    # only use explicit device 0 if we still have no capture device and no Picamera
-    if cap is None and picam is None:
-        try:
-            cap = cv2.VideoCapture(0)
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-            cap.set(cv2.CAP_PROP_FPS, int(target_fps))
-            # quick read checks (some USB cameras need a few frames)
-            ok = False
-            for _ in range(3):
-                ret, _ = cap.read()
-                if ret:
-                    ok = True
-                    break
-                time.sleep(0.06)
-            if ok:
-                print("camera_service: using fallback OpenCV device 0")
-            else:
-                try: cap.release()
-                except Exception: pass
-                cap = None
-        except Exception:
-            cap = None
+    # camera init: reopen the device that worked last run; probe only when it is gone
+    picam, cap = _open_saved_camera(_load_camera_choice(), target_fps)
+    if picam is None and cap is None:
+        picam, cap, choice = _probe_camera(target_fps)
+        if choice is not None:
+            _save_camera_choice(choice)
+    # Picamera2 is configured for RGB-ordered pixels (what MediaPipe wants), USB/GStreamer deliver BGR;
+    # pick the colour codes once so no frame pays for a BGR<->RGB swap
+    frame_is_rgb = picam is not None
+    if frame_is_rgb:
+        to_lab, to_gray = cv2.COLOR_RGB2LAB, cv2.COLOR_RGB2GRAY
+    else:
+        to_lab, to_gray = cv2.COLOR_BGR2LAB, cv2.COLOR_BGR2GRAY
 
     # create unix socket and listen for one client
-    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # SOCK_SEQPACKET keeps one message per send, so no framing is needed and a stalled reader
+    # only costs dropped frames
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
     server.bind(socket_path)
     server.listen(1)
     server.settimeout(0.1)
@@ -107,11 +89,25 @@ def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
 
     client = None
     last_client_accept = 0.0
+    frame_idx = 0
+    roi_shape = None
+    rgb_buf = None
+    equalize_lut = None
+    lut_time = 0.0
+    lab_buf = None
+    l_lut = None  # uint8 form of equalize_lut for the L channel (non-fused path)
+    hud = None  # pre-rendered preview overlay (image, mask); rebuilt on ROI change
     target_dt = 1.0 / max(5.0, min(target_fps, 60.0))
 
+    # capture runs on its own thread so MediaPipe (which releases the GIL) overlaps with camera I/O
+    frame_q = queue.Queue(maxsize=1)
+    free_q = queue.Queue()
+    stop_event = threading.Event()
+    capture_thread = threading.Thread(target=_capture_loop, args=(picam, cap, frame_q, free_q, stop_event, target_dt), daemon=True)
+    capture_thread.start()
+
     try:
         while True:
-            t0 = time.time()
             # accept client if needed (non-blocking)
             if client is None:
                 try:
@@ -123,94 +119,134 @@ def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
                 except Exception:
                     pass
 
-            # capture frame
-            frame = None
+            # newest frame from the capture thread; blocking here paces the loop to the camera,
+            # so a slow MediaPipe frame is followed by the freshest frame rather than a sleep
             try:
-                if picam:
-                    frame = picam.capture_array()
-                elif cap:
-                    ret, f = cap.read()
-                    if ret:
-                        frame = f
-                if frame is None:
-                    time.sleep(target_dt)
-                    continue
-            except Exception:
-                time.sleep(target_dt)
+                raw = frame_q.get(timeout=target_dt)
+            except queue.Empty:
                 continue
 
-            # small enhancement
-            try:
-                lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
-                l, a, b = cv2.split(lab)
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-                l = clahe.apply(l)
-                lab = cv2.merge([l, a, b])
-                frame = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
-            except Exception:
-                pass
-
             # enforce 16:9 for consistent mapping
+            frame = raw
             try:
-                frame = _ensure_16_9_server(frame, CAPTURE_WIDTH, CAPTURE_HEIGHT)
+                frame = _ensure_16_9_server(raw, CAPTURE_WIDTH, CAPTURE_HEIGHT)
                 h, w = frame.shape[:2]
             except Exception:
                 h, w = frame.shape[:2]
+            # the resize made a copy, so the capture buffer can go back to the producer
+            if cap and frame is not raw:
+                free_q.put_nowait(raw)
 
-            roi_w = int(w * ROI_SCALE)
-            roi_h = int(roi_w * 9 / 16)
-            x_start = (w - roi_w) // 2
-            y_start = (h - roi_h) // 2
-            x_end = x_start + roi_w
-            y_end = y_start + roi_h
-            # --- Preview: draw ROI and center crosshair for debugging/visual feedback ---
-            try:
-                win_name = "camera_service_preview"
-                # create window once; harmless if already exists
-                cv2.namedWindow(win_name, cv2.WINDOW_NORMAL)
-                preview = frame.copy()
-                # ROI rectangle (blue)
-                cv2.rectangle(preview, (x_start, y_start), (x_end, y_end), (255, 0, 0), 2)
-                # center crosshair inside ROI
-                cx = x_start + roi_w // 2
-                cy = y_start + roi_h // 2
-                cv2.line(preview, (cx - 20, cy), (cx + 20, cy), (255, 0, 0), 1)
-                cv2.line(preview, (cx, cy - 20), (cx, cy + 20), (255, 0, 0), 1)
-                cv2.putText(preview, "ROI", (x_start + 8, y_start + 28),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2, cv2.LINE_AA)
-                cv2.imshow(win_name, preview)
-                cv2.waitKey(1)
-            except Exception:
-                pass
+            # ROI bounds and projector scale only change with the frame size
+            if (h, w) != roi_shape:
+                roi_shape = (h, w)
+                roi_w = int(w * ROI_SCALE)
+                roi_h = int(roi_w * 9 / 16)
+                x_start = (w - roi_w) // 2
+                y_start = (h - roi_h) // 2
+                x_end = x_start + roi_w
+                y_end = y_start + roi_h
+                proj_scale = (1920.0 / max(1, roi_w), 1080.0 / max(1, roi_h))
+                hud = None
+            frame_idx += 1
 
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            roi = frame[y_start:y_end, x_start:x_end]
+            # only the ROI is ever searched, so convert just that slice into a reused RGB buffer;
+            # everything below works in ROI-local pixels
+            if rgb_buf is None or rgb_buf.shape[:2] != (roi_h, roi_w):
+                rgb_buf = np.empty((roi_h, roi_w, 3), dtype=np.uint8)
+            if FUSED_ENHANCE:
+                # one read of the ROI, one write of equalized RGB; histogram refreshed at ~5 Hz
+                now = time.monotonic()
+                if equalize_lut is None or now - lut_time >= EQUALIZE_LUT_PERIOD:
+                    equalize_lut = _equalize_lut(cv2.cvtColor(roi, to_gray))
+                    lut_time = now
+                _equalize_to_rgb(roi, rgb_buf, equalize_lut, frame_is_rgb)
+                rgb = rgb_buf
+            elif ENHANCE:
+                # same cached equalization, applied to the L channel every frame; LAB->RGB also does
+                # the colour swap, so this costs one conversion more than the plain path
+                if lab_buf is None or lab_buf.shape[:2] != (roi_h, roi_w):
+                    lab_buf = np.empty((roi_h, roi_w, 3), dtype=np.uint8)
+                lab = cv2.cvtColor(roi, to_lab, dst=lab_buf)
+                l = cv2.extractChannel(lab, 0)
+                now = time.monotonic()
+                if l_lut is None or now - lut_time >= EQUALIZE_LUT_PERIOD:
+                    l_lut = _equalize_lut(l).astype(np.uint8)
+                    lut_time = now
+                cv2.insertChannel(cv2.LUT(l, l_lut), lab, 0)
+                rgb = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB, dst=rgb_buf)
+            elif frame_is_rgb:
+                # already RGB: a plain copy keeps the preview overlay out of MediaPipe's input
+                np.copyto(rgb_buf, roi)
+                rgb = rgb_buf
+            else:
+                rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+
+            # --- Preview (ARPI_PREVIEW=1, every 16th frame): draw ROI and center crosshair ---
+            # drawn straight onto `frame`; MediaPipe reads the separate RGB buffer
+            if PREVIEW and (frame_idx & 15) == 0:
+                try:
+                    win_name = "camera_service_preview"
+                    # the overlay is static for a given ROI: rasterize it once, then just masked-copy it
+                    if hud is None:
+                        # create window once; harmless if already exists
+                        cv2.namedWindow(win_name, cv2.WINDOW_NORMAL)
+                        hud_img = np.zeros((h, w, 3), dtype=np.uint8)
+                        # ROI rectangle (blue)
+                        cv2.rectangle(hud_img, (x_start, y_start), (x_end, y_end), (255, 0, 0), 2)
+                        # center crosshair inside ROI
+                        cx = x_start + roi_w // 2
+                        cy = y_start + roi_h // 2
+                        cv2.line(hud_img, (cx - 20, cy), (cx + 20, cy), (255, 0, 0), 1)
+                        cv2.line(hud_img, (cx, cy - 20), (cx, cy + 20), (255, 0, 0), 1)
+                        cv2.putText(hud_img, "ROI", (x_start + 8, y_start + 28),
+                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2, cv2.LINE_AA)
+                        hud = (hud_img, hud_img.any(axis=2, keepdims=True))
+                    # HighGUI shows BGR: RGB frames get their one swap here, on preview frames only
+                    view = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR) if frame_is_rgb else frame
+                    np.copyto(view, hud[0], where=hud[1])
+                    cv2.imshow(win_name, view)
+                    cv2.waitKey(1)
+                except Exception:
+                    pass
+
+            # the whole ROI at a fixed geometry every frame: the detector runs in VIDEO mode and tracks
+            # hands between frames itself (a moving crop would mis-register its stored ROI); palm
+            # detection reruns while fewer than MAX_HANDS are tracked, so new hands appear next frame
             try:
-                res = hands.process(rgb)
+                src = rgb
+                scale = INFER_WIDTH / max(1, w)
+                if scale < 1.0:
+                    src = cv2.resize(rgb, (max(1, int(roi_w * scale)), max(1, int(roi_h * scale))),
+                                     interpolation=cv2.INTER_AREA)
+                detected = detect_hands(src)
             except Exception:
-                res = None
+                detected = None
 
             tips = []
-            if getattr(res, "multi_hand_landmarks", None):
-                for idx, hand_landmarks in enumerate(res.multi_hand_landmarks):
-                    tip = hand_landmarks.landmark[8]
-                    pip = hand_landmarks.landmark[6]
-                    # permissive extension test (helps at distance)
-                    ext = math.hypot(tip.x - pip.x, tip.y - pip.y) > 0.02
-                    x_tip = int(tip.x * w)
-                    y_tip = int(tip.y * h)
-                    if x_start <= x_tip <= x_end and y_start <= y_tip <= y_end and ext:
-                        rel_x = (min(max(x_tip, x_start), x_end) - x_start) / max(1, roi_w)
-                        rel_y = (min(max(y_tip, y_start), y_end) - y_start) / max(1, roi_h)
-                        # map into fixed projector space (1920x1080)
-                        proj_x = int(rel_x * 1920)
-                        proj_y = int(rel_y * 1080)
-                        tips.append({"screen": (proj_x, proj_y), "hand_idx": idx})
-
-            # send tips as one JSON line if client connected
+            if detected:
+                # (N, 21, 2) landmarks in ROI pixels, then filter/map all hands at once
+                n = len(detected)
+                pts = np.fromiter((v for hand in detected for lm in hand for v in (lm.x, lm.y)),
+                                  dtype=np.float32, count=n * 42).reshape(n, 21, 2) * (roi_w, roi_h)
+                # permissive extension test (helps at distance), in full-frame normalized units
+                d = (pts[:, 8] - pts[:, 6]) / (w, h)
+                ext = (d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]) > 0.0004  # 0.02 ** 2, no sqrt
+                pix = pts[:, 8].astype(np.int32)
+                # landmarks may be extrapolated past the ROI edges
+                mask = ext & (pix[:, 0] >= 0) & (pix[:, 0] <= roi_w) & (pix[:, 1] >= 0) & (pix[:, 1] <= roi_h)
+                # map into fixed projector space (1920x1080)
+                proj = (pix * proj_scale).astype(np.int32)
+                for idx in np.flatnonzero(mask).tolist():
+                    tips.append(TIP.pack(idx, int(proj[idx, 0]), int(proj[idx, 1])))
+
+            # send tips as one binary message if client connected (dropped if the reader is behind)
             if client:
                 try:
-                    payload = json.dumps({"ts": time.time(), "tips": tips}) + "\n"
-                    client.sendall(payload.encode("utf-8"))
+                    client.send(HEADER.pack(time.time(), len(tips)) + b"".join(tips), socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    pass
                 except Exception:
                     try:
                         client.close()
@@ -218,11 +254,13 @@ def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
                         pass
                     client = None
 
-            elapsed = time.time() - t0
-            to_sleep = max(0.0, target_dt - elapsed)
-            time.sleep(to_sleep)
-
     finally:
+        stop_event.set()
+        capture_thread.join(timeout=0.5)
+        try:
+            close_detector()
+        except Exception:
+            pass
         try:
             server.close()
         except Exception:
@@ -239,6 +277,206 @@ def main(socket_path=SOCKET_PATH, target_fps=TARGET_FPS):
         except Exception:
             pass
 
+def _equalize_lut(gray, clip=EQUALIZE_CLIP):
+    """Clip-limited histogram equalization table (float32 luma -> luma), refreshed every EQUALIZE_LUT_PERIOD."""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float32)
+    limit = clip * hist.mean()
+    excess = np.maximum(hist - limit, 0).sum()
+    cdf = np.cumsum(np.minimum(hist, limit) + excess / 256.0)
+    return ((cdf - cdf[0]) * (255.0 / max(1.0, cdf[-1] - cdf[0]))).astype(np.float32)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _equalize_to_rgb(src, out, lut, rgb_in):
+        """Equalize luma via lut and write RGB into out, touching each pixel once (src BGR or RGB)."""
+        h, w = src.shape[0], src.shape[1]
+        ri = 0 if rgb_in else 2
+        bi = 2 - ri
+        for y in prange(h):
+            for x in range(w):
+                r = float(src[y, x, ri])
+                g = float(src[y, x, 1])
+                b = float(src[y, x, bi])
+                l = 0.299 * r + 0.587 * g + 0.114 * b
+                scale = lut[int(l)] / max(1.0, l)
+                out[y, x, 0] = min(255, int(r * scale))
+                out[y, x, 1] = min(255, int(g * scale))
+                out[y, x, 2] = min(255, int(b * scale))
+else:
+    _equalize_to_rgb = None
+
+def _capture_loop(picam, cap, frame_q, free_q, stop_event, target_dt):
+    """Producer: keep only the newest captured frame in frame_q (latest-frame-wins).
+
+    OpenCV frames are decoded into buffers recycled through free_q, so steady-state
+    capture does not allocate a new frame per read. The capture source is bound once
+    here so the loop itself does not branch on it.
+    """
+    if picam:
+        grab = picam.capture_array
+    elif cap:
+        def grab():
+            try:
+                buf = free_q.get_nowait()
+            except queue.Empty:
+                buf = None
+            ret, f = cap.read(buf)
+            if ret:
+                return f
+            if buf is not None:
+                free_q.put_nowait(buf)
+            return None
+    else:
+        return
+
+    while not stop_event.is_set():
+        try:
+            frame = grab()
+        except Exception:
+            frame = None
+        if frame is None:
+            time.sleep(target_dt)
+            continue
+        try:
+            stale = frame_q.get_nowait()
+            if cap:
+                free_q.put_nowait(stale)
+        except queue.Empty:
+            pass
+        try:
+            frame_q.put_nowait(frame)
+        except queue.Full:
+            pass
+
+def _load_camera_choice(path=CAMERA_CONFIG):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+def _save_camera_choice(choice, path=CAMERA_CONFIG):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(choice, f)
+    except Exception:
+        pass
+
+def _open_saved_camera(choice, target_fps=TARGET_FPS):
+    """Open the camera recorded by _save_camera_choice; (None, None) if it no longer works."""
+    if not choice:
+        return None, None
+    kind = choice.get("kind")
+    if kind == "gst":
+        cap = _open_gstreamer(choice.get("idx", 0), target_fps)
+        if cap is not None:
+            print(f"camera_service: using saved GStreamer device {choice.get('idx', 0)}")
+        return None, cap
+    if kind == "cv2":
+        cap = _open_cv2(choice.get("idx", 0), target_fps, attempts=3)
+        if cap is not None:
+            print(f"camera_service: using saved OpenCV device {choice.get('idx', 0)}")
+        return None, cap
+    if kind == "picam":
+        picam = _open_picamera()
+        if picam is not None:
+            print("camera_service: using saved Picamera2")
+        return picam, None
+    return None, None
+
+def _probe_camera(target_fps=TARGET_FPS):
+    """Try USB OpenCV (usb index 1) first, then explicit device 0, then Picamera2 last.
+
+    Returns (picam, cap, choice) where choice is what _save_camera_choice persists.
+    """
+    tried_indices = [1, 0]  # first try a likely USB index (1), then device 0
+    for idx in tried_indices:
+        cap = _open_gstreamer(idx, target_fps)
+        if cap is not None:
+            print(f"camera_service: using GStreamer device {idx}")
+            return None, cap, {"kind": "gst", "idx": idx}
+        cap = _open_cv2(idx, target_fps)
+        if cap is not None:
+            print(f"camera_service: using OpenCV device {idx}")
+            return None, cap, {"kind": "cv2", "idx": idx}
+
+    # If no OpenCV USB device opened, try Picamera2 as a last fallback
+    picam = _open_picamera()
+    if picam is not None:
+        print("camera_service: using Picamera2 (fallback)")
+        return picam, None, {"kind": "picam"}
+
+    # only use explicit device 0 if we still have no capture device and no Picamera
+    # (some USB cameras need a few frames)
+    cap = _open_cv2(0, target_fps, attempts=3)
+    if cap is not None:
+        print("camera_service: using fallback OpenCV device 0")
+        return None, cap, {"kind": "cv2", "idx": 0}
+    return None, None, None
+
+def _open_cv2(idx, target_fps=TARGET_FPS, attempts=1):
+    """Open OpenCV device idx and check it delivers a frame; None if it does not."""
+    try:
+        cap = cv2.VideoCapture(idx)
+        try:
+            # newest-frame-only queue and MJPG so USB cams can deliver 720p60
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            cap.set(cv2.CAP_PROP_FPS, int(target_fps))
+        except Exception:
+            pass
+        for attempt in range(attempts):
+            ret, _ = cap.read()
+            if ret:
+                return cap
+            if attempt + 1 < attempts:
+                time.sleep(0.06)
+        try:
+            cap.release()
+        except Exception:
+            pass
+    except Exception:
+        pass
+    return None
+
+def _open_picamera():
+    if Picamera2 is None:
+        return None
+    try:
+        picam = Picamera2()
+        try:
+            # libcamera "BGR888" is R,G,B byte order in numpy: 3 channels, what MediaPipe wants
+            cfg = picam.create_preview_configuration(main={"size": (800, 600), "format": "BGR888"},
+                                                     **PICAM_LOW_LATENCY)
+        except Exception:
+            cfg = picam.create_preview_configuration(main={"size": (640, 480), "format": "BGR888"},
+                                                     **PICAM_LOW_LATENCY)
+        picam.configure(cfg)
+        try:
+            picam.set_controls({"ExposureTime": 20000, "AnalogueGain": 4.0, "AwbEnable": True})
+        except Exception:
+            pass
+        picam.start()
+        return picam
+    except Exception:
+        return None
+
+def _open_gstreamer(idx, target_fps=TARGET_FPS):
+    """Open /dev/video{idx} through the GStreamer appsink pipeline; None if unavailable."""
+    try:
+        cap = cv2.VideoCapture(GST_PIPELINE.format(idx=idx, fps=int(target_fps)), cv2.CAP_GSTREAMER)
+        if cap.isOpened():
+            ret, _ = cap.read()
+            if ret:
+                return cap
+        cap.release()
+    except Exception:
+        pass
+    return None
+
 def _ensure_16_9_server(frame, target_w=CAPTURE_WIDTH, target_h=CAPTURE_HEIGHT):
     try:
         h, w = frame.shape[:2]
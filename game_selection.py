@@ -22,6 +22,10 @@ def show_game_selection(screen, video_manager=None, hand_tracker=None):
     button_margin = 40
     total_height = len(GAMES) * button_height + (len(GAMES) - 1) * button_margin
     start_y = (screen.get_height() - total_height) // 2
+    # buttons never move, so build their rects once
+    button_x = screen.get_width() // 2 - button_width // 2
+    button_rects = [pygame.Rect(button_x, start_y + i * (button_height + button_margin), button_width, button_height)
+                    for i in range(len(GAMES))]
 
     hover_start_time = 0
     hovered_button = None
@@ -29,6 +33,12 @@ def show_game_selection(screen, video_manager=None, hand_tracker=None):
     overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
     overlay.fill((25, 25, 35, 200))  # Semi-transparent dark background
 
+    # static text: render once, blit every frame
+    title = FONT_LARGE.render("ARPi Game Selector", True, TEXT_COLOR)
+    title_pos = (screen.get_width() // 2 - title.get_width() // 2, 50)
+    instructions = FONT_MEDIUM.render("• Hover over a game to select •", True, TEXT_COLOR)
+    instructions_pos = (screen.get_width() // 2 - instructions.get_width() // 2, screen.get_height() - 80)
+
     # remote tip cache updated by pygame.USEREVENT+1 (posted by RemoteCameraClient)
     last_remote_tips = []
     last_remote_primary = None
@@ -76,57 +86,39 @@ def show_game_selection(screen, video_manager=None, hand_tracker=None):
 
         screen.blit(overlay, (0, 0))
 
-        # draw fingertip indicators from the tracker (so you see the circle on the projected table)
-        try:
-            for tip in tips:
-                # tip["screen"] is (x, y) mapped to projector/screen coordinates
-                pos = tip.get("screen")
-                if pos:
-                    # outer ring + inner dot for good visibility
-                    pygame.draw.circle(screen, (0, 0, 0), pos, 16, 4)
-                    pygame.draw.circle(screen, (60, 220, 80), pos, 10)
-        except Exception:
-            pass
-
+        # single pass: hit-test and draw each button
         selected_game = None
-        for i, game in enumerate(GAMES):
-            button_x = screen.get_width() // 2 - button_width // 2
-            button_y = start_y + i * (button_height + button_margin)
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-
-            if button_rect.collidepoint(mouse_pos):
+        for i, (game, button_rect) in enumerate(zip(GAMES, button_rects)):
+            is_hovering = button_rect.collidepoint(mouse_pos)
+            if is_hovering:
                 if hovered_button != i:
                     hovered_button = i
                     hover_start_time = current_time
-                if current_time - hover_start_time >= 1.0:
+                if selected_game is None and current_time - hover_start_time >= 1.0:
                     selected_game = game
-                    break
-            else:
-                if hovered_button == i:
-                    hovered_button = None
+            elif hovered_button == i:
+                hovered_button = None
+            # keep drawing every button even once one is selected
+            draw_button(screen, button_rect.x, button_rect.y, button_width, button_height, game["name"], is_hovering)
+            if is_hovering and selected_game is None:
+                hover_time = current_time - hover_start_time
+                # draw hover timer where appropriate
+                draw_hover_timer(screen, mouse_pos, hover_time)
 
         if selected_game:
             from player_selection import show_game_player_selection
             show_game_player_selection(screen, selected_game, video_manager, hand_tracker=hand_tracker)
             hovered_button = None
+            # the sub-screen drew over this frame; start a fresh one instead of flipping it
+            continue
 
-        title = FONT_LARGE.render("ARPi Game Selector", True, TEXT_COLOR)
-        screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 50))
-
-        for i, game in enumerate(GAMES):
-            button_x = screen.get_width() // 2 - button_width // 2
-            button_y = start_y + i * (button_height + button_margin)
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-            is_hovering = button_rect.collidepoint(mouse_pos)
-            draw_button(screen, button_x, button_y, button_width, button_height, game["name"], is_hovering)
-            if is_hovering and hovered_button == i:
-                hover_time = current_time - hover_start_time
-                # draw hover timer where appropriate
-                draw_hover_timer(screen, mouse_pos, hover_time)
+        screen.blit(title, title_pos)
+        screen.blit(instructions, instructions_pos)
 
         # draw fingertip indicators last so they appear on top of all UI
         try:
             for tip in tips:
+                # tip["screen"] is (x, y) mapped to projector/screen coordinates
                 pos = tip.get("screen")
                 if pos:
                     pygame.draw.circle(screen, (0, 0, 0), pos, 16, 4)
@@ -134,9 +126,6 @@ def show_game_selection(screen, video_manager=None, hand_tracker=None):
         except Exception:
             pass
 
-        instructions = FONT_MEDIUM.render("• Hover over a game to select •", True, TEXT_COLOR)
-        screen.blit(instructions, (screen.get_width() // 2 - instructions.get_width() // 2, screen.get_height() - 80))
-
         pygame.display.flip()
         clock.tick(60)
     return True
\ No newline at end of file
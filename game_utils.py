@@ -1,44 +1,40 @@
+import functools
+import numpy as np
 import pygame
 from constants import PROPERTIES, BOARD_ORIG_SIZE, CORNER_SIZE, EDGE_TILE_SIZE, PROPERTY_SPACE_INDICES
 
+# player side layouts indexed by player count (index 0 = no players)
+_SQUARE_POSITIONS = (
+    (),
+    ("bottom",),
+    ("top", "bottom"),
+    ("top", "right", "bottom"),
+    ("top", "right", "bottom", "left"),
+    ("top", "top", "right", "bottom", "bottom"),
+    ("top", "top", "right", "bottom", "bottom", "left"),
+    ("top", "top", "top", "right", "bottom", "bottom", "bottom"),
+    ("top", "top", "top", "right", "bottom", "bottom", "bottom", "left"),
+)
+_OTHER_POSITIONS = (
+    (),
+    ("bottom",),
+    ("top", "bottom"),
+    ("top", "bottom", "bottom"),
+    ("top", "top", "bottom", "bottom"),
+    ("top", "top", "bottom", "bottom", "right"),
+    ("top", "top", "bottom", "bottom", "right", "left"),
+    ("top", "top", "top", "bottom", "bottom", "bottom", "right"),
+    ("top", "top", "top", "bottom", "bottom", "bottom", "right", "left"),
+)
+
+_POSITION_TABLES = {"square": _SQUARE_POSITIONS}
+
 def get_player_positions(num_players, board_shape):
-    """Get player positions based on count and board shape"""
-    positions = []
-    if board_shape == "square":
-        if num_players == 1:
-            positions = ["bottom"]
-        elif num_players == 2:
-            positions = ["top", "bottom"]
-        elif num_players == 3:
-            positions = ["top", "right", "bottom"]
-        elif num_players == 4:
-            positions = ["top", "right", "bottom", "left"]
-        elif num_players == 5:
-            positions = ["top", "top", "right", "bottom", "bottom"]
-        elif num_players == 6:
-            positions = ["top", "top", "right", "bottom", "bottom", "left"]
-        elif num_players == 7:
-            positions = ["top", "top", "top", "right", "bottom", "bottom", "bottom"]
-        elif num_players == 8:
-            positions = ["top", "top", "top", "right", "bottom", "bottom", "bottom", "left"]
-    else:
-        if num_players == 1:
-            positions = ["bottom"]
-        elif num_players == 2:
-            positions = ["top", "bottom"]
-        elif num_players == 3:
-            positions = ["top", "bottom", "bottom"]
-        elif num_players == 4:
-            positions = ["top", "top", "bottom", "bottom"]
-        elif num_players == 5:
-            positions = ["top", "top", "bottom", "bottom", "right"]
-        elif num_players == 6:
-            positions = ["top", "top", "bottom", "bottom", "right", "left"]
-        elif num_players == 7:
-            positions = ["top", "top", "top", "bottom", "bottom", "bottom", "right"]
-        elif num_players == 8:
-            positions = ["top", "top", "top", "bottom", "bottom", "bottom", "right", "left"]
-    return positions
+    """Get player positions based on count and board shape (read-only tuple)"""
+    table = _POSITION_TABLES.get(board_shape, _OTHER_POSITIONS)
+    if 0 <= num_players < len(table):
+        return table[num_players]
+    return ()
 
 def get_action_rectangles(player_idx, position, side, count_on_side, player_index_on_side, player_width, player_height):
     """Calculate rectangles for action buttons based on player position and side rectangle"""
@@ -88,33 +84,13 @@ def load_board_image(game_width, game_height, image_path="monopoly.jpg"):
         print("Could not load board image. Using default representation.")
         return None, 0, 0
 
-def get_property_centers(board_x, board_y, display_width, display_height, count):
-    """
-    Compute precise centers for board spaces based on the original 2000x2000 artwork layout,
-    scaled to the on-screen board image.
-
-    - Produces 40 space centers ordered clockwise starting at index 0 = bottom-right corner (GO),
-      then along bottom edge (right->left), left edge (bottom->top), top edge (left->right),
-      and right edge (top->bottom).
-    - If `count` equals len(PROPERTIES) and PROPERTY_SPACE_INDICES is defined, returns centers
-      for those mapped property space indices (so each property appears at its canonical board space).
-    - If count == 40 returns all 40 centers.
-    - Otherwise falls back to an even-perimeter approximation for `count` items.
-    """
+def _build_orig_centers():
+    """40 space centers in original artwork coords, clockwise from GO (bottom-right corner)."""
     orig_w, orig_h = BOARD_ORIG_SIZE
     corner_w, corner_h = CORNER_SIZE
     tb_tile_w, tb_tile_h = EDGE_TILE_SIZE["top_bottom"]
     lr_tile_w, lr_tile_h = EDGE_TILE_SIZE["left_right"]
 
-    # scale factor (board image is square because original is square)
-    scale = display_width / orig_w if orig_w else 1.0
-
-    # helper to scale original coords into screen coords
-    def to_screen(orig_x, orig_y):
-        sx = board_x + int(round(orig_x * scale))
-        sy = board_y + int(round(orig_y * scale))
-        return (sx, sy)
-
     centers = [None] * 40
 
     # Bottom-right corner (index 0)
@@ -146,24 +122,55 @@ def get_property_centers(board_x, board_y, display_width, display_height, count)
         x = orig_w - lr_tile_w / 2.0
         y = corner_h + lr_tile_h * (m - 0.5)
         centers[30 + m] = (x, y)
+    return np.array(centers, dtype=np.float32)
+
+# built once at import; get_property_centers only scales/offsets these
+_ORIG_CENTERS = _build_orig_centers()
+_PROPERTY_IDX = (np.array(PROPERTY_SPACE_INDICES, dtype=np.int32)
+                 if isinstance(PROPERTY_SPACE_INDICES, (list, tuple)) else None)
 
-    # convert to screen coords (apply scaling & board_x/board_y)
-    screen_centers = [to_screen(cx, cy) for (cx, cy) in centers]
+def get_property_centers(board_x, board_y, display_width, display_height, count):
+    """
+    Return cached board-space centers (tuple of (x, y)); see _compute_centers.
+    Inputs only change on resize, so per-frame calls are a cache hit.
+    """
+    return _compute_centers(int(board_x), int(board_y), int(display_width), int(display_height), int(count))
+
+@functools.lru_cache(maxsize=8)
+def _compute_centers(board_x, board_y, display_width, display_height, count):
+    """
+    Compute precise centers for board spaces based on the original 2000x2000 artwork layout,
+    scaled to the on-screen board image.
+
+    - Produces 40 space centers ordered clockwise starting at index 0 = bottom-right corner (GO),
+      then along bottom edge (right->left), left edge (bottom->top), top edge (left->right),
+      and right edge (top->bottom).
+    - If `count` equals len(PROPERTIES) and PROPERTY_SPACE_INDICES is defined, returns centers
+      for those mapped property space indices (so each property appears at its canonical board space).
+    - If count == 40 returns all 40 centers.
+    - Otherwise falls back to an even-perimeter approximation for `count` items.
+    """
+    orig_w = BOARD_ORIG_SIZE[0]
+
+    # scale factor (board image is square because original is square)
+    scale = display_width / orig_w if orig_w else 1.0
+
+    # scale original coords into screen coords in one float32 pass (rint == round half-to-even)
+    scaled = np.rint(_ORIG_CENTERS * np.float32(scale)).astype(np.int32)
+    scaled[:, 0] += board_x
+    scaled[:, 1] += board_y
 
     # If the caller asked for standard properties count and mapping exists, return mapped centers
-    if count == len(PROPERTIES) and isinstance(PROPERTY_SPACE_INDICES, (list, tuple)):
-        mapped = []
-        for idx in PROPERTY_SPACE_INDICES:
-            if 0 <= idx < len(screen_centers):
-                mapped.append(screen_centers[idx])
-            else:
-                # safety fallback to center of board if mapping is bad
-                mapped.append((board_x + display_width // 2, board_y + display_height // 2))
-        return mapped
+    if count == len(PROPERTIES) and _PROPERTY_IDX is not None:
+        valid = (_PROPERTY_IDX >= 0) & (_PROPERTY_IDX < len(scaled))
+        mapped = scaled[np.where(valid, _PROPERTY_IDX, 0)]
+        # safety fallback to center of board if mapping is bad
+        mapped[~valid] = (board_x + display_width // 2, board_y + display_height // 2)
+        return tuple(map(tuple, mapped.tolist()))
 
     # If caller asked for full 40, return them
     if count == 40:
-        return screen_centers
+        return tuple(map(tuple, scaled.tolist()))
 
     # Fallback: evenly sample along the perimeter (keeps previous behaviour for other counts)
     left = board_x
@@ -171,23 +178,14 @@ def get_property_centers(board_x, board_y, display_width, display_height, count)
     right = board_x + display_width
     bottom = board_y + display_height
     perimeter = 2 * (display_width + display_height)
-    approx = []
-    for i in range(count):
-        t = (i / count) * perimeter
-        if t < display_width:
-            x = right - t
-            y = bottom
-        elif t < display_width + display_height:
-            t2 = t - display_width
-            x = left
-            y = bottom - t2
-        elif t < 2 * display_width + display_height:
-            t2 = t - (display_width + display_height)
-            x = left + t2
-            y = top
-        else:
-            t2 = t - (2 * display_width + display_height)
-            x = right
-            y = top + t2
-        approx.append((int(x), int(y)))
-    return approx
\ No newline at end of file
+    t = np.arange(count, dtype=np.float32) * np.float32(perimeter / count) if count else np.zeros(0, np.float32)
+    # edges in order: bottom (right->left), left (bottom->top), top (left->right), right (top->bottom)
+    edges = [t < display_width,
+             t < display_width + display_height,
+             t < 2 * display_width + display_height]
+    x = np.select(edges, [right - t, np.full_like(t, left), left + (t - (display_width + display_height))],
+                  default=right)
+    y = np.select(edges, [np.full_like(t, bottom), bottom - (t - display_width), np.full_like(t, top)],
+                  default=top + (t - (2 * display_width + display_height)))
+    approx = np.stack((x, y), axis=1).astype(np.int32)
+    return tuple(map(tuple, approx.tolist()))
@@ -0,0 +1,104 @@
+import os
+import time
+import mediapipe as mp
+
+# MediaPipe Tasks model bundle (shipped next to this file); the legacy solutions API is the fallback
+HAND_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hand_landmarker.task")
+# try the HandLandmarker GPU delegate (Pi 5 VideoCore / desktop GPUs) before the CPU one;
+# ARPI_GPU_DELEGATE=0 keeps inference on the CPU
+USE_GPU_DELEGATE = os.environ.get("ARPI_GPU_DELEGATE", "1") != "0"
+# consecutive detect() errors before giving up on a backend (a single bad frame shouldn't)
+FAILURES_BEFORE_FALLBACK = 3
+
+def _tasks_backend(delegate, max_hands, detection_conf, tracking_conf):
+    """HandLandmarker in VIDEO mode (tracking between frames stays on) on the named delegate."""
+    from mediapipe.tasks import python as mp_tasks
+    from mediapipe.tasks.python import vision
+    base = mp_tasks.BaseOptions(model_asset_path=HAND_MODEL_PATH,
+                                delegate=getattr(mp_tasks.BaseOptions.Delegate, delegate))
+    opts = vision.HandLandmarkerOptions(base_options=base, running_mode=vision.RunningMode.VIDEO,
+                                        num_hands=max_hands,
+                                        min_hand_detection_confidence=detection_conf,
+                                        min_hand_presence_confidence=tracking_conf,
+                                        min_tracking_confidence=tracking_conf)
+    landmarker = vision.HandLandmarker.create_from_options(opts)
+    last_ts = [0]
+
+    def detect(rgb):
+        # VIDEO mode needs strictly increasing timestamps
+        ts = max(last_ts[0] + 1, int(time.monotonic() * 1000))
+        last_ts[0] = ts
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        return landmarker.detect_for_video(image, ts).hand_landmarks
+
+    return detect, landmarker.close
+
+def _legacy_backend(max_hands, detection_conf, tracking_conf, model_complexity):
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_hands,
+        model_complexity=model_complexity,
+        min_detection_confidence=detection_conf,
+        min_tracking_confidence=tracking_conf
+    )
+
+    def detect(rgb):
+        res = hands.process(rgb)
+        return [hl.landmark for hl in (res.multi_hand_landmarks or [])]
+
+    return detect, hands.close
+
+def create_hand_detector(max_hands, detection_conf, tracking_conf, model_complexity, log_prefix="hand_detector"):
+    """Return (detect, close); detect(rgb) gives one 21-landmark sequence per hand.
+
+    Backends in order: Tasks HandLandmarker on the GPU delegate (when USE_GPU_DELEGATE),
+    the same on the CPU delegate, then the legacy solutions Hands graph. A backend that
+    fails to build, or keeps failing in detect(), is closed and the next one takes over.
+    """
+    backends = []
+    if USE_GPU_DELEGATE:
+        backends.append(("HandLandmarker GPU delegate",
+                         lambda: _tasks_backend("GPU", max_hands, detection_conf, tracking_conf)))
+    backends.append(("HandLandmarker CPU delegate",
+                     lambda: _tasks_backend("CPU", max_hands, detection_conf, tracking_conf)))
+    backends.append(("legacy Hands",
+                     lambda: _legacy_backend(max_hands, detection_conf, tracking_conf, model_complexity)))
+    # active backend: [label, detect, close, consecutive failures]
+    active = [None, None, None, 0]
+
+    def close():
+        if active[2]:
+            try:
+                active[2]()
+            except Exception:
+                pass
+        active[1] = active[2] = None
+
+    def fall_back():
+        close()
+        while backends:
+            label, build = backends.pop(0)
+            try:
+                active[1], active[2] = build()
+                active[0], active[3] = label, 0
+                return
+            except Exception as e:
+                if not backends:
+                    raise
+                print(f"{log_prefix}: {label} unavailable ({e})")
+
+    def detect(rgb):
+        try:
+            hands = active[1](rgb)
+        except Exception as e:
+            active[3] += 1
+            if active[3] < FAILURES_BEFORE_FALLBACK or not backends:
+                raise
+            print(f"{log_prefix}: {active[0]} failing ({e}), falling back")
+            fall_back()
+            return active[1](rgb)
+        active[3] = 0
+        return hands
+
+    fall_back()
+    return detect, close
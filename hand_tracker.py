@@ -1,73 +1,154 @@
+import os
 import cv2
-import mediapipe as mp
 import math
 import numpy as np
+import functools
 try:
-    from picamera2 import Picamera2
+    from numba import njit
 except Exception:
-    Picamera2 = None
-import pyautogui
+    njit = None
 import time
+import queue
 import threading
 from typing import List, Dict, Tuple, Optional
 from constants import CAPTURE_WIDTH, CAPTURE_HEIGHT, CAPTURE_ASPECT
+from hand_detector import create_hand_detector
+
+# core pinning, applied by start(): capture on cores 0-1 and inference on 2-3 so camera traffic
+# doesn't evict the landmark model from L2. ARPI_PIN_CPUS=1 forces it, 0 disables it; the
+# default ("auto") pins only on a Raspberry Pi with 4+ cores
+PIN_CPUS = os.environ.get("ARPI_PIN_CPUS", "auto")
+CAPTURE_CPUS = {0, 1}
+INFERENCE_CPUS = {2, 3}
+
+# Picamera2: two buffers and no request queue, so each capture waits for the next sensor
+# frame instead of returning one that sat in the queue; frame time limited to 30-60 fps
+PICAM_LOW_LATENCY = {"buffer_count": 2, "queue": False,
+                     "controls": {"FrameDurationLimits": (16666, 33333)}}
+
+# gamma applied to luma after CLAHE; the LUT is a constant, so build it once at import
+GAMMA = 1.15
+GAMMA_LUT = (255.0 * np.power(np.arange(256, dtype=np.float32) / 255.0, 1.0 / GAMMA)).astype(np.uint8)
 
 # --- added: simple One Euro filters for smooth, responsive tracking ---
-class _LowPass:
-    def __init__(self, alpha: float = 1.0):
-        self.alpha = alpha
-        self.s = None
-
-    def apply(self, v):
-        if self.s is None:
-            self.s = v
-            return v
-        self.s = self.alpha * v + (1.0 - self.alpha) * self.s
-        return self.s
-
-def _alpha(dt: float, cutoff: float) -> float:
-    r = 2.0 * math.pi * cutoff * dt
-    return r / (r + 1.0) if r > 0.0 else 1.0
-
-class OneEuro1D:
-    """1D One Euro filter (fast, low-latency smoothing)."""
-    def __init__(self, freq=60.0, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
-        self.freq = max(1e-3, freq)
-        self.min_cutoff = min_cutoff
-        self.beta = beta
-        self.d_cutoff = d_cutoff
-        self.x_prev = None
-        self.dx_prev = None
-        self.last_t = None
-        self._lp_x = _LowPass()
-        self._lp_dx = _LowPass()
-
-    def reset(self):
-        self.x_prev = None
-        self.dx_prev = None
-        self.last_t = None
-        self._lp_x = _LowPass()
-        self._lp_dx = _LowPass()
-
-    def update(self, x, t: float):
-        if self.last_t is None:
-            self.last_t = t
-            self.x_prev = x
-            self.dx_prev = 0.0
-            return x
-        dt = max(1e-3, t - self.last_t)
-        self.last_t = t
-        # derivative
-        dx = (x - self.x_prev) / dt
-        a_d = _alpha(dt, self.d_cutoff)
-        edx = self._lp_dx.apply(a_d * dx + (1 - a_d) * (self.dx_prev if self.dx_prev is not None else dx))
-        # adaptive cutoff
-        cutoff = self.min_cutoff + self.beta * abs(edx)
-        a = _alpha(dt, cutoff)
-        filtered = self._lp_x.apply(a * x + (1 - a) * (self.x_prev if self.x_prev is not None else x))
-        self.x_prev = filtered
-        self.dx_prev = edx
-        return filtered
+# per-channel One Euro parameters for (screen_x, screen_y, roi_x, roi_y)
+_EURO_MIN_CUTOFF = np.array([1.0, 1.0, 1.5, 1.5])
+_EURO_BETA = np.array([0.007, 0.007, 0.01, 0.01])
+_EURO_D_CUTOFF = np.array([1.0, 1.0, 1.0, 1.0])
+
+if njit is not None:
+    @njit(cache=True)
+    def _one_euro_batch(x, rows, t, x_prev, dx_prev, last_t, min_cutoff, beta, d_cutoff):
+        """One Euro filter update for every hand/channel in one call; state arrays are updated in place.
+
+        x is (n, 4) raw values for hands `rows`; state is (max_hands, 4), last_t (max_hands,) NaN = fresh.
+        """
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            r = rows[i]
+            lt = last_t[r]
+            if lt != lt:
+                for c in range(x.shape[1]):
+                    x_prev[r, c] = x[i, c]
+                    dx_prev[r, c] = 0.0
+                    out[i, c] = x[i, c]
+                last_t[r] = t
+                continue
+            dt = max(1e-3, t - lt)
+            last_t[r] = t
+            for c in range(x.shape[1]):
+                dx = (x[i, c] - x_prev[r, c]) / dt
+                rd = 2.0 * math.pi * d_cutoff[c] * dt
+                a_d = rd / (rd + 1.0) if rd > 0.0 else 1.0
+                edx = a_d * dx + (1.0 - a_d) * dx_prev[r, c]
+                rc = 2.0 * math.pi * (min_cutoff[c] + beta[c] * abs(edx)) * dt
+                a = rc / (rc + 1.0) if rc > 0.0 else 1.0
+                f = a * x[i, c] + (1.0 - a) * x_prev[r, c]
+                x_prev[r, c] = f
+                dx_prev[r, c] = edx
+                out[i, c] = f
+        return out
+else:
+    def _one_euro_batch(x, rows, t, x_prev, dx_prev, last_t, min_cutoff, beta, d_cutoff):
+        """NumPy fallback for the Numba kernel: same update, vectorized over hands x channels."""
+        lt = last_t[rows]
+        new = np.isnan(lt)
+        fresh = new[:, None]
+        dt = np.maximum(1e-3, t - np.where(new, t, lt))[:, None]
+        # fresh slots seed from the raw value (x_prev = x, dx_prev = 0 makes the blend a no-op)
+        xp = np.where(fresh, x, x_prev[rows])
+        dxp = np.where(fresh, 0.0, dx_prev[rows])
+        w = 2.0 * math.pi * dt
+        r = w * d_cutoff
+        a_d = r / (r + 1.0)
+        edx = a_d * (x - xp) / dt + (1.0 - a_d) * dxp
+        r = w * (min_cutoff + beta * np.abs(edx))
+        a = r / (r + 1.0)
+        out = a * x + (1.0 - a) * xp
+        x_prev[rows] = out
+        dx_prev[rows] = edx
+        last_t[rows] = t
+        return out
+
+# pyautogui (X display query) and picamera2 (libcamera) are slow to import and
+# often unused: import them only when actually needed
+@functools.lru_cache(maxsize=1)
+def _default_screen_size() -> Tuple[int,int]:
+    try:
+        import pyautogui
+        w, h = pyautogui.size()
+        return int(w), int(h)
+    except Exception:
+        return 1920, 1080
+
+@functools.lru_cache(maxsize=1)
+def _load_picamera2():
+    try:
+        from picamera2 import Picamera2
+        return Picamera2
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _is_raspberry_pi():
+    try:
+        with open("/proc/device-tree/model") as f:
+            return "Raspberry Pi" in f.read()
+    except Exception:
+        return False
+
+def _should_pin_cpus():
+    if PIN_CPUS == "0" or not hasattr(os, "sched_setaffinity") or (os.cpu_count() or 1) < 4:
+        return False
+    return PIN_CPUS == "1" or _is_raspberry_pi()
+
+def _pin_current_thread(cpus):
+    """Restrict the calling thread to `cpus` (Linux only; no-op elsewhere or on failure)."""
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except Exception:
+        pass
+
+def _ensure_16_9_local(frame, target_w=CAPTURE_WIDTH, target_h=CAPTURE_HEIGHT):
+    try:
+        h, w = frame.shape[:2]
+        target_ar = target_w / max(1, target_h)
+        cur_ar = w / max(1, h)
+        if abs(cur_ar - target_ar) < 1e-6:
+            return cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
+        if cur_ar > target_ar:
+            new_w = int(h * target_ar)
+            x0 = (w - new_w) // 2
+            cropped = frame[:, x0:x0 + new_w]
+        else:
+            new_h = int(w / target_ar)
+            y0 = (h - new_h) // 2
+            cropped = frame[y0:y0 + new_h, :]
+        return cv2.resize(cropped, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
+    except Exception:
+        return cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
 
 class MultiHandTracker:
     """
@@ -86,42 +167,77 @@ class MultiHandTracker:
                  target_fps: float = 60.0,
                  smoothing: float = 0.6,
                  usb_index: int = 0,
-                 prefer_usb: bool = True):
-        self.screen_w, self.screen_h = screen_size if screen_size else pyautogui.size()
-        mp_hands = mp.solutions.hands
-        self.hands = mp_hands.Hands(
-            max_num_hands=max_hands,
-            min_detection_confidence=detection_conf,
-            min_tracking_confidence=tracking_conf
-        )
+                 prefer_usb: bool = True,
+                 inference_size: Optional[Tuple[int,int]] = (480, 270),
+                 enhance_threshold: float = 110.0,
+                 model_complexity: int = 0,
+                 idle_skip: int = 3,
+                 idle_after: int = 10,
+                 enhance: Optional[bool] = None):
+        self.screen_w, self.screen_h = screen_size if screen_size else _default_screen_size()
+        # the detector is built on the (pinned) worker thread so MediaPipe's executor and XNNPACK
+        # threads inherit its CPU affinity; it is then kept across start()/stop() until close()
+        self._detector_args = (max_hands, detection_conf, tracking_conf, model_complexity)
+        self._detect = None
+        self._close_detector = None
 
         self.colors = [
             (0, 255, 0), (255, 0, 0), (0, 0, 255), (255, 255, 0),
             (255, 0, 255), (0, 255, 255), (128, 0, 128), (255, 165, 0)
         ]
         self.roi_scale = roi_scale
+        # MediaPipe input size; landmarks are normalized so ROI/screen mapping uses the full frame
+        self.inference_size = inference_size
 
         # camera selection
         self._usb_index = usb_index
         self._prefer_usb = prefer_usb
-        self._picam: Optional[Picamera2] = None
+        self._picam = None  # Picamera2 instance when used
         self._cap: Optional[cv2.VideoCapture] = None
         self._use_picam = False
+        # Picamera2 is configured to deliver RGB-ordered pixels, USB cameras deliver BGR
+        self._capture_is_rgb = False
+        # Picamera2 ISP-scaled second stream at inference resolution (Pi 5); False = resize on the CPU
+        self._picam_lores = False
+        # per-thread CPU sets decided in start(); None = leave scheduling to the OS
+        self._capture_cpus = None
+        self._inference_cpus = None
 
         # thread & state
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._capture_thread: Optional[threading.Thread] = None
+        # latest-frame-wins hand-off from the capture thread to the processing worker
+        self._frame_q: "queue.Queue[Tuple[np.ndarray, Optional[np.ndarray]]]" = queue.Queue(maxsize=1)
         self._lock = threading.RLock()
-        self._latest_tips: List[Dict] = []
-        self._last_seen: Dict[int, float] = {}
-        self._smoothed: Dict[int, Tuple[int,int]] = {}
-        self._smoothed_roi: Dict[int, Tuple[int,int]] = {}
-        # keep OneEuro filters per-dimension per-hand for better smoothing
-        self._filters_screen: Dict[int, Tuple[OneEuro1D, OneEuro1D]] = {}
-        self._filters_roi: Dict[int, Tuple[OneEuro1D, OneEuro1D]] = {}
+        # (tips, frame) published by the worker with one reference swap; readers take no lock
+        self._snapshot: Tuple[Tuple[Dict, ...], Optional[np.ndarray]] = ((), None)
+        # per hand slot: last smoothed (screen_x, screen_y, roi_x, roi_y) and when it was last detected
+        self._smoothed_xy = np.zeros((max_hands, 4), dtype=np.int32)
+        self._last_seen = np.full(max_hands, -np.inf)
         self._alpha = smoothing  # legacy fallback (not used when filters present)
+        # batched One Euro state, one row per hand slot
+        self._euro_x = np.zeros((max_hands, 4))
+        self._euro_dx = np.zeros((max_hands, 4))
+        self._euro_t = np.full(max_hands, np.nan)
         self._target_dt = 1.0 / max(5.0, min(target_fps, 60.0))
 
+        # enhancement state built once (was rebuilt every frame)
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+        self._gamma_lut = GAMMA_LUT
+        # skip enhancement when the strided mean brightness is above this (0..255)
+        self.enhance_threshold = enhance_threshold
+        # None = decide in start(): off for Picamera2 (exposure/gain already set), on for USB cameras
+        self._enhance = enhance
+        # enhance_frame scratch buffers (the returned frame is reused on the next call)
+        self._yuv_buf: Optional[np.ndarray] = None
+        self._enhanced_buf: Optional[np.ndarray] = None
+        # after idle_after frames with no tips, only process every idle_skip-th frame until a hand shows up
+        self.idle_skip = max(1, int(idle_skip))
+        self.idle_after = idle_after
+        self._miss_count = 0
+        self._frame_idx = 0
+
     def start(self):
         if self._running:
             return
@@ -133,6 +249,8 @@ class MultiHandTracker:
                 cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
                 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
                 cap.set(cv2.CAP_PROP_FPS, int(min(60, 1.0 / max(0.001, self._target_dt))))
+                # keep the driver queue shallow so the capture thread never reads stale frames
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             except Exception:
                 pass
             found = False
@@ -160,6 +278,8 @@ class MultiHandTracker:
                     cap0.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
                     cap0.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
                     cap0.set(cv2.CAP_PROP_FPS, int(min(60, 1.0 / max(0.001, self._target_dt))))
+                    # keep the driver queue shallow so the capture thread never reads stale frames
+                    cap0.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 except Exception:
                     pass
                 found0 = False
@@ -180,14 +300,33 @@ class MultiHandTracker:
                 self._cap = None
 
         # 3) Picamera2 as last fallback
-        if self._cap is None and Picamera2 is not None:
+        Picamera2 = _load_picamera2() if self._cap is None else None
+        if Picamera2 is not None:
             try:
                 self._picam = Picamera2()
-                try:
-                    cfg = self._picam.create_preview_configuration(main={"size": (800, 600)})
-                except Exception:
-                    cfg = self._picam.create_preview_configuration(main={"size": (640, 480)})
-                self._picam.configure(cfg)
+                # libcamera "BGR888" is R,G,B byte order in numpy: 3 channels, already what MediaPipe wants.
+                # first choice adds an RGB lores stream at inference width so the ISP does the full-frame
+                # downscale (Pi 5 only; older ISPs reject RGB lores and we fall through)
+                candidates = []
+                if self.inference_size:
+                    lw = self.inference_size[0] & ~1
+                    candidates.append(({"size": (800, 600), "format": "BGR888"},
+                                       {"size": (lw, (lw * 3 // 4) & ~1), "format": "BGR888"}))
+                candidates.append(({"size": (800, 600), "format": "BGR888"}, None))
+                candidates.append(({"size": (640, 480), "format": "BGR888"}, None))
+                self._picam_lores = False
+                for main_cfg, lores_cfg in candidates:
+                    try:
+                        if lores_cfg:
+                            cfg = self._picam.create_preview_configuration(main=main_cfg, lores=lores_cfg,
+                                                                            **PICAM_LOW_LATENCY)
+                        else:
+                            cfg = self._picam.create_preview_configuration(main=main_cfg, **PICAM_LOW_LATENCY)
+                        self._picam.configure(cfg)
+                        self._picam_lores = lores_cfg is not None
+                        break
+                    except Exception:
+                        continue
                 try:
                     self._picam.set_controls({
                         "ExposureTime": 20000,
@@ -203,20 +342,37 @@ class MultiHandTracker:
                 except Exception:
                     pass
                 self._use_picam = True
+                self._capture_is_rgb = True
             except Exception:
                 self._picam = None
                 self._use_picam = False
 
+        if self._enhance is None:
+            self._enhance = not self._use_picam
+
+        cv2.setUseOptimized(True)
+        if _should_pin_cpus():
+            self._capture_cpus, self._inference_cpus = CAPTURE_CPUS, INFERENCE_CPUS
+            # OpenCV's pool would inherit the affinity of whichever pinned thread started it first;
+            # run its calls on the (already pinned) calling thread instead
+            cv2.setNumThreads(1)
+        else:
+            self._capture_cpus = self._inference_cpus = None
+
         self._running = True
+        self._capture_thread = threading.Thread(target=self._capture_worker, daemon=True)
+        self._capture_thread.start()
         self._thread = threading.Thread(target=self._worker, daemon=True)
         self._thread.start()
-        time.sleep(0.05)
 
     def stop(self):
         self._running = False
         if self._thread:
             self._thread.join(timeout=0.5)
             self._thread = None
+        if self._capture_thread:
+            self._capture_thread.join(timeout=0.5)
+            self._capture_thread = None
         if self._picam:
             try:
                 self._picam.stop()
@@ -230,50 +386,52 @@ class MultiHandTracker:
                 pass
             self._cap = None
 
+    def close(self):
+        """Stop the tracker and release the hand detector (and its GPU/CPU graph)."""
+        self.stop()
+        with self._lock:
+            close_detector = self._close_detector
+            self._detect = None
+            self._close_detector = None
+        if close_detector:
+            try:
+                close_detector()
+            except Exception:
+                pass
+
     def enhance_frame(self, frame: np.ndarray) -> np.ndarray:
         try:
-            lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
-            l, a, b = cv2.split(lab)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-            l = clahe.apply(l)
-            lab = cv2.merge([l, a, b])
-            frame = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
-            gamma = 1.15
-            lut = np.array([((i/255.0)**(1.0/gamma))*255 for i in np.arange(0,256)]).astype("uint8")
-            frame = cv2.LUT(frame, lut)
+            # cheap brightness probe on a sparse grid; well-lit frames don't need CLAHE/gamma
+            if frame[::16, ::16].mean() > self.enhance_threshold:
+                return frame
+            # CLAHE + gamma both act on luma only: one color round-trip, single-channel LUT;
+            # only Y is pulled out and written back, U/V stay in place
+            if self._yuv_buf is None or self._yuv_buf.shape != frame.shape:
+                self._yuv_buf = np.empty_like(frame)
+                self._enhanced_buf = np.empty_like(frame)
+            to_yuv, from_yuv = ((cv2.COLOR_RGB2YUV, cv2.COLOR_YUV2RGB) if self._capture_is_rgb
+                                else (cv2.COLOR_BGR2YUV, cv2.COLOR_YUV2BGR))
+            yuv = cv2.cvtColor(frame, to_yuv, dst=self._yuv_buf)
+            y = cv2.LUT(self._clahe.apply(cv2.extractChannel(yuv, 0)), self._gamma_lut)
+            cv2.insertChannel(y, yuv, 0)
+            frame = cv2.cvtColor(yuv, from_yuv, dst=self._enhanced_buf)
         except Exception:
             pass
         return frame
 
-    @staticmethod
-    def _distance_coords(a, b) -> float:
-        return math.hypot(a[0]-b[0], a[1]-b[1])
-
-def _ensure_16_9_local(frame, target_w=CAPTURE_WIDTH, target_h=CAPTURE_HEIGHT):
-    try:
-        h, w = frame.shape[:2]
-        target_ar = target_w / max(1, target_h)
-        cur_ar = w / max(1, h)
-        if abs(cur_ar - target_ar) < 1e-6:
-            return cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
-        if cur_ar > target_ar:
-            new_w = int(h * target_ar)
-            x0 = (w - new_w) // 2
-            cropped = frame[:, x0:x0 + new_w]
-        else:
-            new_h = int(w / target_ar)
-            y0 = (h - new_h) // 2
-            cropped = frame[y0:y0 + new_h, :]
-        return cv2.resize(cropped, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
-    except Exception:
-        return cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_LINEAR)
-
-    def _capture_frame(self) -> Optional[np.ndarray]:
+    def _capture_frame(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Return (frame, infer): the 16:9 display frame and, with a lores stream, an ISP-scaled
+        full-frame image already at inference size (else None)."""
+        frame = None
+        infer = None
         if self._picam:
             try:
-                frame = self._picam.capture_array()
+                if self._picam_lores:
+                    (frame, infer), _ = self._picam.capture_arrays(["main", "lores"])
+                else:
+                    frame = self._picam.capture_array()
             except Exception:
-                return None
+                return None, None
         if self._cap:
             ret, frame = self._cap.read()
             if not ret:
@@ -282,132 +440,197 @@ def _ensure_16_9_local(frame, target_w=CAPTURE_WIDTH, target_h=CAPTURE_HEIGHT):
                     self._cap = cv2.VideoCapture(0)
                 except Exception:
                     pass
-                return None
+                return None, None
         if frame is None:
-            return None
+            return None, None
         # ensure 16:9 center-crop/resize before processing
         try:
             frame = _ensure_16_9_local(frame, CAPTURE_WIDTH, CAPTURE_HEIGHT)
         except Exception:
             pass
-        return frame
+        if infer is not None:
+            # same center crop as the main stream, so lores pixels map onto the frame by scale alone
+            try:
+                iw = self.inference_size[0]
+                scale = iw / frame.shape[1]  # matches the worker's resize target exactly
+                infer = _ensure_16_9_local(infer, iw, max(1, int(frame.shape[0] * scale)))
+            except Exception:
+                infer = None
+        return frame, infer
 
-    def _worker(self):
-        """Capture + MediaPipe processing loop."""
+    def _capture_worker(self):
+        """Producer: keep only the newest frame so processing never works on a stale one."""
+        _pin_current_thread(self._capture_cpus)
         while self._running:
-            t0 = time.time()
-            frame = self._capture_frame()
+            frame, infer = self._capture_frame()
             if frame is None:
                 time.sleep(self._target_dt)
                 continue
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frame_q.put_nowait((frame, infer))
+            except queue.Full:
+                pass
 
-            frame = self.enhance_frame(frame)
-            h, w = frame.shape[:2]
-
-            roi_w = int(w * self.roi_scale)
-            roi_h = int(roi_w * 9 / 16)
-            x_start = (w - roi_w) // 2
-            y_start = (h - roi_h) // 2
-            x_end, y_end = x_start + roi_w, y_start + roi_h
+    def _worker(self):
+        """MediaPipe processing loop (frames come from _capture_worker)."""
+        _pin_current_thread(self._inference_cpus)
+        if self._detect is None:
+            detect, close_detector = create_hand_detector(*self._detector_args, log_prefix="hand_tracker")
+            with self._lock:
+                # stop()/close() may have run (and given up joining us) while the detector was built
+                if not self._running:
+                    close_detector()
+                    return
+                self._detect, self._close_detector = detect, close_detector
+        # scratch buffers reused across frames (reallocated only on shape change)
+        small_buf = None
+        rgb_buf = None
+        # ROI bounds + pixel->screen scale/offset, recomputed only when the frame shape changes
+        roi_shape = None
+        roi = None
+        # absolute-deadline pacing on the monotonic high-resolution clock
+        next_deadline = time.perf_counter()
+        while self._running:
+            try:
+                frame, infer = self._frame_q.get(timeout=self._target_dt)
+            except queue.Empty:
+                continue
+            self._frame_idx += 1
+            if self._miss_count > self.idle_after and self._frame_idx % self.idle_skip:
+                continue
 
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            h, w = frame.shape[:2]
+            # always the whole frame at a fixed geometry: the detector runs in VIDEO mode and tracks
+            # hands between frames itself, which a moving crop would mis-register. Palm detection
+            # reruns whenever fewer than max_hands are tracked, so a new hand shows up on the next
+            # processed frame (idle_skip frames at most while no hands are present)
+            small = frame
+            if self.inference_size and self.inference_size[0] < w:
+                scale = self.inference_size[0] / w
+                iw, ih = max(1, int(w * scale)), max(1, int(h * scale))
+                if small_buf is None or small_buf.shape[:2] != (ih, iw):
+                    small_buf = np.empty((ih, iw, 3), dtype=np.uint8)
+                if infer is not None and infer.shape[:2] == (ih, iw):
+                    small = infer  # the ISP already scaled the frame
+                else:
+                    small = cv2.resize(small, (iw, ih), dst=small_buf, interpolation=cv2.INTER_AREA)
+            if self._enhance:
+                small = self.enhance_frame(small)
+
+            if (h, w) != roi_shape:
+                roi_shape = (h, w)
+                roi_w = int(w * self.roi_scale)
+                roi_h = int(roi_w * 9 / 16)
+                x_start = (w - roi_w) // 2
+                y_start = (h - roi_h) // 2
+                # frame pixel -> screen is one affine map: screen = pix * scale + offset
+                scr_scale = np.array([self.screen_w / max(1, roi_w), self.screen_h / max(1, roi_h)])
+                roi = (x_start, y_start, x_start + roi_w, y_start + roi_h,
+                       scr_scale, -np.array([x_start, y_start]) * scr_scale)
+            x_start, y_start, x_end, y_end, scr_scale, scr_offset = roi
+
+            if self._capture_is_rgb:
+                # Picamera2 frames are already RGB: no conversion pass
+                rgb = np.ascontiguousarray(small)
+            else:
+                if rgb_buf is None or rgb_buf.shape != small.shape:
+                    rgb_buf = np.empty_like(small)
+                rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            # read-only view lets the legacy Hands graph wrap the pixels by reference instead of copying them;
+            # the flag lives on the view, so our reused buffers (and frame) stay writable
+            rgb = rgb.view()
+            rgb.flags.writeable = False
             try:
-                res = self.hands.process(rgb)
+                hands_lm = self._detect(rgb)
             except Exception:
-                res = None
+                hands_lm = None
 
             tips = []
-            if getattr(res, "multi_hand_landmarks", None):
-                for idx, hand_landmarks in enumerate(res.multi_hand_landmarks):
-                    tip = hand_landmarks.landmark[8]
-                    pip = hand_landmarks.landmark[6]
-                    extended = self._distance_coords((tip.x, tip.y, tip.z if hasattr(tip,'z') else 0),
-                                                     (pip.x, pip.y, pip.z if hasattr(pip,'z') else 0)) > 0.02
-                    x_tip = int(tip.x * w)
-                    y_tip = int(tip.y * h)
-                    if x_start <= x_tip <= x_end and y_start <= y_tip <= y_end and extended:
-                        rel_x = (min(max(x_tip, x_start), x_end) - x_start) / max(1, roi_w)
-                        rel_y = (min(max(y_tip, y_start), y_end) - y_start) / max(1, roi_h)
-                        screen_x = int(rel_x * self.screen_w)
-                        screen_y = int(rel_y * self.screen_h)
-                        tips.append({"screen": (screen_x, screen_y), "roi": (x_tip, y_tip), "hand_idx": idx})
+            if hands_lm:
+                # (N, 21, 2) landmarks in frame pixels (normalized -> scaled by the frame size)
+                n = len(hands_lm)
+                pts = np.fromiter((v for hl in hands_lm for l in hl for v in (l.x, l.y)),
+                                  dtype=np.float32, count=n * 42).reshape(n, 21, 2) * (w, h)
+                d = (pts[:, 8] - pts[:, 6]) / (w, h)
+                extended = (d[:, 0] * d[:, 0] + d[:, 1] * d[:, 1]) > 0.0004  # 0.02 ** 2, no sqrt
+                pix = pts[:, 8].astype(np.int32)
+                mask = (extended & (pix[:, 0] >= x_start) & (pix[:, 0] <= x_end)
+                        & (pix[:, 1] >= y_start) & (pix[:, 1] <= y_end))
+                # masked tips are inside the ROI already, so no clamp before scaling
+                scr = (pix * scr_scale + scr_offset).astype(np.int32)
+                for idx in np.flatnonzero(mask).tolist():
+                    tips.append({"screen": (int(scr[idx, 0]), int(scr[idx, 1])),
+                                 "roi": (int(pix[idx, 0]), int(pix[idx, 1])), "hand_idx": idx})
+
+            self._miss_count = 0 if tips else self._miss_count + 1
 
             now = time.time()
             with self._lock:
                 # Use OneEuro filters for smooth, low-latency tracking
-                new_smoothed: Dict[int, Tuple[int,int]] = {}
-                new_smoothed_roi: Dict[int, Tuple[int,int]] = {}
-                freq = 1.0 / max(1e-3, self._target_dt)
-                for t in tips:
-                    hid = t["hand_idx"]
-                    sx_raw, sy_raw = t["screen"]
-                    rx_raw, ry_raw = t["roi"]
-                    # ensure filters exist
-                    if hid not in self._filters_screen:
-                        # min_cutoff low for smooth, beta > 0 to follow fast moves
-                        self._filters_screen[hid] = (OneEuro1D(freq=freq, min_cutoff=1.0, beta=0.007, d_cutoff=1.0),
-                                                     OneEuro1D(freq=freq, min_cutoff=1.0, beta=0.007, d_cutoff=1.0))
-                    if hid not in self._filters_roi:
-                        self._filters_roi[hid] = (OneEuro1D(freq=freq, min_cutoff=1.5, beta=0.01, d_cutoff=1.0),
-                                                  OneEuro1D(freq=freq, min_cutoff=1.5, beta=0.01, d_cutoff=1.0))
-                    fx, fy = self._filters_screen[hid]
-                    frx, fry = self._filters_roi[hid]
-                    fx_val = int(round(fx.update(sx_raw, now)))
-                    fy_val = int(round(fy.update(sy_raw, now)))
-                    frx_val = int(round(frx.update(rx_raw, now)))
-                    fry_val = int(round(fry.update(ry_raw, now)))
-                    new_smoothed[hid] = (fx_val, fy_val)
-                    new_smoothed_roi[hid] = (frx_val, fry_val)
-                    self._last_seen[hid] = now
-
-                # keep recent ones briefly to avoid flicker
-                for hid, (sx, sy) in list(self._smoothed.items()):
-                    if hid not in new_smoothed:
-                        age = now - self._last_seen.get(hid, 0)
-                        if age < 0.25:
-                            new_smoothed[hid] = (sx, sy)
-                            if hid in self._smoothed_roi:
-                                new_smoothed_roi[hid] = self._smoothed_roi[hid]
-                        else:
-                            self._last_seen.pop(hid, None)
-
-                self._smoothed = new_smoothed
-                self._smoothed_roi = new_smoothed_roi
-
-                out = []
-                for k in sorted(self._smoothed.keys()):
-                    item = {"screen": self._smoothed[k], "hand_idx": k}
-                    roi = self._smoothed_roi.get(k)
-                    if roi is not None:
-                        item["roi"] = roi
-                    out.append(item)
-                self._latest_tips = out
-
-            elapsed = time.time() - t0
-            to_sleep = max(0.0, self._target_dt - elapsed)
-            time.sleep(to_sleep)
+                if tips:
+                    # all hands x (screen_x, screen_y, roi_x, roi_y) in one batched call
+                    rows = np.array([t["hand_idx"] for t in tips], dtype=np.int64)
+                    raw = np.array([t["screen"] + t["roi"] for t in tips], dtype=np.float64)
+                    filt = _one_euro_batch(raw, rows, now, self._euro_x, self._euro_dx, self._euro_t,
+                                           _EURO_MIN_CUTOFF, _EURO_BETA, _EURO_D_CUTOFF)
+                    self._smoothed_xy[rows] = np.rint(filt)
+                    self._last_seen[rows] = now
+
+                # keep recent ones briefly to avoid flicker; slots come out in hand_idx order
+                active = np.flatnonzero((now - self._last_seen) < 0.25)
+                out = [{"screen": (sx, sy), "hand_idx": hid, "roi": (rx, ry)}
+                       for hid, (sx, sy, rx, ry) in zip(active.tolist(), self._smoothed_xy[active].tolist())]
+
+            # atomic publish (single attribute store under the GIL)
+            self._snapshot = (tuple(out), frame)
+
+            next_deadline += self._target_dt
+            to_sleep = next_deadline - time.perf_counter()
+            if to_sleep > 0:
+                time.sleep(to_sleep)
+            elif to_sleep < -2 * self._target_dt:
+                # stalled (slow frame / camera hiccup): re-anchor instead of racing to catch up
+                next_deadline = time.perf_counter()
 
     def draw_tips(self, frame: np.ndarray) -> np.ndarray:
         if frame is None:
             return frame
         h, w = frame.shape[:2]
-        with self._lock:
-            for hid, roi in self._smoothed_roi.items():
-                if roi is None:
-                    continue
-                rx, ry = int(roi[0]), int(roi[1])
-                col = self.colors[hid % len(self.colors)]
-                radius = max(6, int(min(w, h) * 0.025))
-                try:
-                    cv2.circle(frame, (rx, ry), radius, col, 2)
-                    cv2.circle(frame, (rx, ry), max(2, radius // 3), col, -1)
-                except Exception:
-                    pass
+        radius = max(6, int(min(w, h) * 0.025))
+        # the inner dot is invisible next to the 2px ring on small frames; skip it there
+        dot = radius // 3 if radius // 3 >= 3 else 0
+        colors = self.colors
+        for tip in self._snapshot[0]:
+            roi = tip.get("roi")
+            if roi is None:
+                continue
+            center = (int(roi[0]), int(roi[1]))
+            col = colors[tip["hand_idx"] % len(colors)]
+            try:
+                cv2.circle(frame, center, radius, col, 2)
+                if dot:
+                    cv2.circle(frame, center, dot, col, -1)
+            except Exception:
+                pass
         return frame
 
     def get_tips(self) -> List[Dict]:
-        with self._lock:
-            return list(self._latest_tips)
+        return list(self._snapshot[0])
+
+    def get_last_frame(self) -> Optional[np.ndarray]:
+        """Frame the latest tips were computed from (use with draw_tips instead of re-capturing).
+
+        BGR for USB cameras, RGB when capturing from Picamera2.
+        """
+        return self._snapshot[1]
+
+    def get_tips_and_frame(self) -> Tuple[List[Dict], Optional[np.ndarray]]:
+        tips, frame = self._snapshot
+        return list(tips), frame
 
     def get_primary(self) -> Optional[Tuple[int,int]]:
         tips = self.get_tips()
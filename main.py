@@ -65,7 +65,8 @@ def main():
             pass
         if hand_tracker is not None:
             try:
-                hand_tracker.stop()
+                # close() also releases the landmarker (and its GPU graph), which stop() keeps warm
+                hand_tracker.close()
             except Exception:
                 pass
         pygame.quit()
@@ -123,14 +123,15 @@ def _assign_tips_to_players(tips, player_rects, game_width, game_height):
     if not tips or not player_rects:
         return assigned
     thresh = max(160, min(game_width, game_height) * 0.35)
+    thresh2 = thresh * thresh  # compare squared distances: same nearest tip, no sqrt
     for pi, rect in enumerate(player_rects):
         ax, ay = rect.centerx, rect.centery
         best = None; best_d = None
         for t in tips:
-            tx, ty = t["screen"]; d = math.hypot(tx - ax, ty - ay)
+            tx, ty = t["screen"]; dx = tx - ax; dy = ty - ay; d = dx * dx + dy * dy
             if best is None or d < best_d:
                 best = t; best_d = d
-        if best is not None and best_d <= thresh:
+        if best is not None and best_d <= thresh2:
             assigned[pi] = (best["screen"][0], best["screen"][1], best["hand_idx"])
     return assigned
 
@@ -1,6 +1,7 @@
 import asyncio
 import threading
 import json
+import struct
 import time
 import cv2
 import numpy as np
@@ -16,6 +17,19 @@ SERVER_URI = "ws://192.168.1.79:8765"  # << replace with your Windows IP
 JPEG_QUALITY = 60
 FPS = 60.0
 SEND_WIDTH = 1280
+# Picamera2: two buffers and no request queue, so every capture is the newest sensor frame
+PICAM_LOW_LATENCY = {"buffer_count": 2, "queue": False,
+                     "controls": {"FrameDurationLimits": (16666, 33333)}}
+# server tips frame: uint8 count, then per tip (hand_idx, roi_x, roi_y, screen_x, screen_y); see server_windows
+TIP_COUNT = struct.Struct("<B")
+TIP_RECORD = struct.Struct("<Bhhhh")
+
+def _decode_tips(msg):
+    """Decode a binary tips frame into the same dicts the JSON protocol produced."""
+    n, = TIP_COUNT.unpack_from(msg)
+    body = memoryview(msg)[TIP_COUNT.size:TIP_COUNT.size + n * TIP_RECORD.size]
+    return [{"hand_idx": hid, "roi": (rx, ry), "screen": (sx, sy)}
+            for hid, rx, ry, sx, sy in TIP_RECORD.iter_unpack(body)]
 
 class RemoteCameraClient:
     def __init__(self, server_uri=SERVER_URI, usb_index=0, prefer_usb=True, fps=FPS):
@@ -96,9 +110,12 @@ class RemoteCameraClient:
             try:
                 self._picam = Picamera2()
                 try:
-                    cfg = self._picam.create_preview_configuration(main={"size": (800,600)})
+                    # libcamera "RGB888" is B,G,R in numpy: what imencode expects, so no swap before JPEG
+                    cfg = self._picam.create_preview_configuration(main={"size": (800,600), "format": "RGB888"},
+                                                                    **PICAM_LOW_LATENCY)
                 except Exception:
-                    cfg = self._picam.create_preview_configuration(main={"size": (640,480)})
+                    cfg = self._picam.create_preview_configuration(main={"size": (640,480), "format": "RGB888"},
+                                                                    **PICAM_LOW_LATENCY)
                 self._picam.configure(cfg)
                 self._picam.start()
                 print("network_client: using Picamera2 (fallback)")
@@ -172,16 +189,15 @@ class RemoteCameraClient:
                             msg = await ws.recv()
                             if isinstance(msg, (bytes, bytearray)):
                                 try:
-                                    text = msg.decode('utf-8', errors='ignore')
-                                    data = json.loads(text)
+                                    tips = _decode_tips(msg)
                                 except Exception:
                                     continue
                             else:
+                                # older servers send JSON text
                                 try:
-                                    data = json.loads(msg)
+                                    tips = json.loads(msg).get("tips", [])
                                 except Exception:
                                     continue
-                            tips = data.get("tips", [])
                             with self._lock:
                                 self._latest_tips = tips
                             # Post a pygame event so the main UI can react immediately
@@ -1,16 +1,26 @@
 import asyncio
-import json
+import os
+import struct
 import time
-import math
 import cv2
 import numpy as np
 import mediapipe as mp
 import websockets
 
-# Simple WebSocket server: receive JPEG frames (binary), return JSON tips.
+# Simple WebSocket server: receive JPEG frames (binary), return tips as a binary frame.
 HOST = "192.168.1.79"
 PORT = 8765
 PROJECTOR_W, PROJECTOR_H = 1920, 1080  # change if needed
+# show the client video every Nth frame; 0 = headless (no window at all)
+PREVIEW_EVERY = int(os.environ.get("ARPI_PREVIEW_EVERY", "3"))
+# MediaPipe resizes to ~224px internally; feed it a downscaled frame (landmarks are normalized)
+INFER_WIDTH = 480
+# no desktop (headless Linux box): never create the window, whatever ARPI_PREVIEW_EVERY says
+if os.name != "nt" and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+    PREVIEW_EVERY = 0
+# tips frame: uint8 count, then per tip (hand_idx, roi_x, roi_y, screen_x, screen_y); keep in sync with network_client
+TIP_COUNT = struct.Struct("<B")
+TIP_RECORD = struct.Struct("<Bhhhh")
 
 mp_hands = mp.solutions.hands
 # Use lower model_complexity for faster, lower-latency inference on the Windows server.
@@ -36,12 +46,16 @@ async def handle(ws, path=None):
     saw_video = False
     last_tips_announce = 0.0
     last_tips = []
+    frame_idx = 0
+    rgb_buf = None  # reused BGR->RGB buffer, reallocated only if the client's frame size changes
+    small_buf = None  # reused downscale buffer for inference
     try:
         # create window for this client
-        try:
-            cv2.namedWindow(win_name, cv2.WINDOW_NORMAL)
-        except Exception:
-            pass
+        if PREVIEW_EVERY > 0:
+            try:
+                cv2.namedWindow(win_name, cv2.WINDOW_NORMAL)
+            except Exception:
+                pass
 
         async for msg in ws:
             # Expect binary JPEG frames
@@ -54,7 +68,17 @@ async def handle(ws, path=None):
                 if frame is None:
                     continue
                 h, w = frame.shape[:2]
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frame_idx += 1
+                show = PREVIEW_EVERY > 0 and frame_idx % PREVIEW_EVERY == 0
+                small = frame
+                if w > INFER_WIDTH:
+                    ih = max(1, int(h * INFER_WIDTH / w))
+                    if small_buf is None or small_buf.shape[:2] != (ih, INFER_WIDTH):
+                        small_buf = np.empty((ih, INFER_WIDTH, 3), dtype=np.uint8)
+                    small = cv2.resize(frame, (INFER_WIDTH, ih), dst=small_buf, interpolation=cv2.INTER_AREA)
+                if rgb_buf is None or rgb_buf.shape != small.shape:
+                    rgb_buf = np.empty_like(small)
+                rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_buf)
                 try:
                     res = hands.process(rgb)
                 except Exception:
@@ -65,19 +89,22 @@ async def handle(ws, path=None):
                     for idx, lm in enumerate(res.multi_hand_landmarks):
                         tip = lm.landmark[8]
                         pip = lm.landmark[6]
-                        ext = math.hypot(tip.x - pip.x, tip.y - pip.y) > 0.02
+                        dx = tip.x - pip.x
+                        dy = tip.y - pip.y
+                        ext = (dx * dx + dy * dy) > 0.0004  # 0.02 ** 2, no sqrt
                         x_tip = int(tip.x * w)
                         y_tip = int(tip.y * h)
                         if ext:
                             proj_x = int(tip.x * PROJECTOR_W)
                             proj_y = int(tip.y * PROJECTOR_H)
                             tips.append({"hand_idx": idx, "roi": (x_tip, y_tip), "screen": (proj_x, proj_y)})
-                            # draw circle on frame around index tip
-                            try:
-                                cv2.circle(frame, (x_tip, y_tip), max(6, int(min(w,h)*0.03)), (0,255,0), 2)
-                                cv2.circle(frame, (x_tip, y_tip), max(2, int(min(w,h)*0.01)), (0,255,0), -1)
-                            except Exception:
-                                pass
+                            # draw circle on frame around index tip (only when it will be shown)
+                            if show:
+                                try:
+                                    cv2.circle(frame, (x_tip, y_tip), max(6, int(min(w,h)*0.03)), (0,255,0), 2)
+                                    cv2.circle(frame, (x_tip, y_tip), max(2, int(min(w,h)*0.01)), (0,255,0), -1)
+                                except Exception:
+                                    pass
 
                 # update last_tips for periodic announcements
                 last_tips = tips
@@ -91,14 +118,19 @@ async def handle(ws, path=None):
                         print("server: no tips detected in last 5s")
 
                 # show the frame for this client
-                try:
-                    cv2.imshow(win_name, frame)
-                    # required to update window events; value small to be non-blocking
-                    cv2.waitKey(1)
-                except Exception:
-                    pass
+                if show:
+                    try:
+                        cv2.imshow(win_name, frame)
+                        # required to update window events; value small to be non-blocking
+                        cv2.waitKey(1)
+                    except Exception:
+                        pass
 
-                payload = json.dumps({"ts": time.time(), "tips": tips})
+                payload = bytearray(TIP_COUNT.size + TIP_RECORD.size * len(tips))
+                TIP_COUNT.pack_into(payload, 0, len(tips))
+                for i, t in enumerate(tips):
+                    TIP_RECORD.pack_into(payload, TIP_COUNT.size + i * TIP_RECORD.size,
+                                         t["hand_idx"], *t["roi"], *t["screen"])
                 try:
                     await ws.send(payload)
                 except Exception:
@@ -115,10 +147,11 @@ async def handle(ws, path=None):
         pass
     finally:
         # destroy window on disconnect
-        try:
-            cv2.destroyWindow(win_name)
-        except Exception:
-            pass
+        if PREVIEW_EVERY > 0:
+            try:
+                cv2.destroyWindow(win_name)
+            except Exception:
+                pass
         print(f"server: client disconnected (peer={peer})")
         return
 